@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+import threading
+import concurrent.futures
+from collections import defaultdict
+
+from GangaCore.Utility.Config import getConfig
+from GangaCore.Utility.logging import getLogger
+
+logger = getLogger()
+
+
+class SubmissionExecutor(object):
+
+    """
+    Executor used for the preparation and submission of (sub)jobs.
+
+    This is deliberately kept separate from the monitoring thread pool so that a large submission
+    cannot starve the monitoring loop (and vice versa). Work is returned as concurrent.futures.Future
+    objects so that errors raised in a worker are propagated back to the caller rather than leaving
+    it waiting on a status which will never change.
+
+    Concurrency is bounded globally by the size of the pool and additionally per group (typically the
+    backend name) by getConfig('Queues')['MaxSubmissionsPerBackend'].
+    """
+
+    __slots__ = ('_num_workers', '_group_limit', '_thread_pool', '_process_pool', '_semaphores', '_lock')
+
+    def __init__(self, num_workers=None, group_limit=None):
+        if num_workers is None:
+            num_workers = getConfig('Queues')['NumSubmissionThreads']
+        if group_limit is None:
+            group_limit = getConfig('Queues')['MaxSubmissionsPerBackend']
+        self._num_workers = max(1, num_workers)
+        self._group_limit = group_limit
+        self._thread_pool = None
+        self._process_pool = None
+        self._semaphores = defaultdict(self._make_semaphore)
+        self._lock = threading.Lock()
+
+    def _make_semaphore(self):
+        if self._group_limit:
+            return threading.BoundedSemaphore(self._group_limit)
+        return None
+
+    def _get_pool(self, use_processes=False):
+        with self._lock:
+            if use_processes:
+                if self._process_pool is None:
+                    self._process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=self._num_workers)
+                return self._process_pool
+            if self._thread_pool is None:
+                self._thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self._num_workers,
+                                                                          thread_name_prefix='Ganga_Submit_')
+            return self._thread_pool
+
+    def _run_in_group(self, group, function, args, kwargs):
+        semaphore = self._semaphores[group]
+        if semaphore is None:
+            return function(*args, **kwargs)
+        with semaphore:
+            return function(*args, **kwargs)
+
+    def submit(self, function, *args, group=None, use_processes=False, **kwargs):
+        """
+        Schedule function(*args, **kwargs) and return a Future for the result.
+        Args:
+            function (callable): The function to execute
+            group (str): Name of the group (e.g. backend) this call counts against for concurrency limits
+            use_processes (bool): Run in a process pool, function and arguments must be picklable
+        """
+        if use_processes:
+            # The group limit cannot be enforced inside another process, the pool size bounds this instead
+            return self._get_pool(True).submit(function, *args, **kwargs)
+        return self._get_pool().submit(self._run_in_group, group, function, args, kwargs)
+
+    def map_ordered(self, function, arg_list, group=None, use_processes=False, progress_callback=None):
+        """
+        Run function over each tuple of arguments in arg_list and return the results in the same order.
+
+        All of the work is waited for before returning. If any call raised then the pending calls are
+        cancelled and the first exception encountered is re-raised in the calling thread.
+        Args:
+            function (callable): The function to execute
+            arg_list (list): List of argument tuples, one per call
+            group (str): Name of the group this work counts against for concurrency limits
+            use_processes (bool): Run in a process pool rather than threads
+            progress_callback (callable): Called as progress_callback(n_done, n_total) after each completion
+        """
+        futures = {}
+        for index, args in enumerate(arg_list):
+            futures[self.submit(function, *args, group=group, use_processes=use_processes)] = index
+
+        results = [None] * len(futures)
+        n_done = 0
+        first_error = None
+        for future in concurrent.futures.as_completed(futures):
+            n_done += 1
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                if first_error is None:
+                    first_error = error
+                    for other in futures:
+                        other.cancel()
+                continue
+            results[futures[future]] = future.result()
+            if progress_callback is not None:
+                try:
+                    progress_callback(n_done, len(futures))
+                except Exception as err:
+                    logger.debug("Error in submission progress callback: %s" % err)
+
+        if first_error is not None:
+            raise first_error
+        return results
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            for pool in (self._thread_pool, self._process_pool):
+                if pool is not None:
+                    pool.shutdown(wait=wait)
+            self._thread_pool = None
+            self._process_pool = None
+
+
+_submission_executor = None
+_executor_lock = threading.Lock()
+
+
+def getSubmissionExecutor():
+    """
+    Return the session-wide SubmissionExecutor, creating it if needed
+    """
+    global _submission_executor
+    with _executor_lock:
+        if _submission_executor is None:
+            _submission_executor = SubmissionExecutor()
+        return _submission_executor
+
+
+def shutDownSubmissionExecutor():
+    global _submission_executor
+    with _executor_lock:
+        if _submission_executor is not None:
+            _submission_executor.shutdown()
+        _submission_executor = None
@@ -119,6 +119,13 @@ def _unprotected_ganga_exitfuncs():
     except Exception as err:
         logger.exception("Exception raised while purging shutting down queues: %s" % err)
 
+    # Shutdown the submission executor
+    try:
+        from GangaCore.Core.GangaThread.WorkerThreads.SubmissionExecutor import shutDownSubmissionExecutor
+        shutDownSubmissionExecutor()
+    except Exception as err:
+        logger.exception("Exception raised while shutting down submission executor: %s" % err)
+
     # shutdown the repositories
     try:
         logger.info("Shutting Down Ganga Repositories")
@@ -149,9 +149,11 @@ class IBackend(GangaObject):
         # Shall we submit in parallel
         if parallel_submit:
 
-            from GangaCore.Core.GangaThread.WorkerThreads import getQueues
+            import concurrent.futures
+            from GangaCore.Core.GangaThread.WorkerThreads.SubmissionExecutor import getSubmissionExecutor
 
-            threads_before = getQueues().totalNumIntThreads()
+            executor = getSubmissionExecutor()
+            futures = {}
 
             for sc, sj in zip(subjobconfigs, rjobs):
 
@@ -166,21 +168,21 @@ class IBackend(GangaObject):
                         credential_store.create(b.credential_requirements)
 
                 fqid = sj.getFQID('.')
-                # FIXME would be nice to move this to the internal threads not user ones
-                getQueues()._monitoring_threadpool.add_function(self._parallel_submit, (b, sj, sc, master_input_sandbox,
-                                                                                        fqid, logger), callback_func=self._successfulSubmit, callback_args=(sj, incomplete_subjobs))
-
-            def subjob_status_check(rjobs):
-                has_submitted = True
-                for sj in rjobs:
-                    if sj.status not in ["submitted", "failed", "completed", "running", "completing"] and sj.getFQID('.') not in incomplete_subjobs:
-                        has_submitted = False
-                        break
-                return has_submitted
+                futures[executor.submit(self._parallel_submit, b, sj, sc, master_input_sandbox, fqid, logger,
+                                        group=getName(b))] = sj
 
-            while not subjob_status_check(rjobs):
-                import time
-                time.sleep(1.)
+            n_done = 0
+            for future in concurrent.futures.as_completed(futures):
+                sj = futures[future]
+                try:
+                    out = future.result()
+                except Exception as err:
+                    logger.error("Parallel Job Submission Failed: %s" % err)
+                    out = 0
+                self._successfulSubmit(out, sj, incomplete_subjobs)
+                n_done += 1
+                if n_done % 1000 == 0:
+                    logger.info("Submitted %s/%s subjobs" % (n_done, len(futures)))
 
             if incomplete_subjobs:
                 raise IncompleteJobSubmissionError(
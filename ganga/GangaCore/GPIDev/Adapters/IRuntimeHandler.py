@@ -22,6 +22,10 @@ class IRuntimeHandler(object):
 
     __slots__ = list()
 
+    # Set to True in handlers whose prepare() is CPU bound and picklable so that parallel submission
+    # may run it in a process pool when getConfig('Queues')['PrepareInSubprocess'] is enabled
+    cpu_bound_prepare = False
+
     def master_prepare(self, app, appmasterconfig):
         """ Prepare  the shared/master aspect of  the job submission.
         Called  once  per  job  (both  split and  not-split).  If  the
@@ -4,12 +4,18 @@
 # $Id: ISplitter.py,v 1.1 2008-07-17 16:40:52 moscicki Exp $
 ##########################################################################
 
+import threading
+from copy import deepcopy
+
 from GangaCore.GPIDev.Base import GangaObject
 from GangaCore.GPIDev.Base.Proxy import TypeMismatchError, isType, stripProxy, getName
 from GangaCore.GPIDev.Schema import Schema, Version
 from GangaCore.Utility.util import containsGangaObjects
 from GangaCore.Core.exceptions import GangaException, SplitterError
 
+# Holds the master job currently being split and the copy-on-write templates taken from it
+_split_context = threading.local()
+
 
 class ISplitter(GangaObject):
 
@@ -21,6 +27,19 @@ class ISplitter(GangaObject):
 
     __slots__ = list()
 
+    # Component attributes of the master job which subjobs share copy-on-write during validatedSplit().
+    # A subjob only makes its own copy of one of these when the attribute is first accessed.
+    _copy_on_write_attributes = ('backend', 'postprocessors', 'virtualization', 'outputfiles')
+
+    @staticmethod
+    def _getCopyOnWriteTemplates(job):
+        """ Return the dict of copy-on-write templates for the job currently being split, or None
+        if job isn't being split by validatedSplit()
+        """
+        if getattr(_split_context, 'job', None) is not job:
+            return None
+        return _split_context.templates
+
     def createSubjob(self, job, additional_skip_args=None):
         """ Create a new subjob by copying the master job and setting all fields correctly.
         """
@@ -28,17 +47,56 @@ class ISplitter(GangaObject):
         if additional_skip_args is None:
             additional_skip_args = []
 
-        j = Job()
         skipping_args = ['splitter', 'inputsandbox', 'inputfiles', 'inputdata', 'subjobs']
         for arg in additional_skip_args:
             skipping_args.append(arg)
-        j.copyFrom(job, skipping_args)
+
+        templates = self._getCopyOnWriteTemplates(job)
+        if templates is None:
+            j = Job()
+            j.copyFrom(job, skipping_args)
+        else:
+            j = self._copyOnWriteSubjob(job, skipping_args, templates)
         j.splitter = None
         j.inputsandbox = []
         j.inputfiles = []
         j.inputdata = None
         return j
 
+    def _copyOnWriteSubjob(self, job, skipping_args, templates):
+        """ Equivalent of Job().copyFrom(job, skipping_args) used during validatedSplit().
+        Attributes in _copy_on_write_attributes reference a single snapshot of the master's value which is taken
+        on first use and shared by all subjobs. Defaults are only constructed for the attributes which aren't copied.
+        Args:
+            job (Job): The master job being split
+            skipping_args (list): Names of the attributes which should take their default value
+            templates (dict): The copy-on-write snapshots of the master taken so far during this split
+        """
+        from GangaCore.GPIDev.Lib.Job.Job import Job
+        j = Job.getNew()
+        for name, item in job._schema.allItems():
+            if item['getter']:
+                continue
+            if name in skipping_args or not item['copyable']:
+                setattr(j, name, job._schema.getDefaultValue(name))
+                continue
+            if name in self._copy_on_write_attributes:
+                if name not in templates:
+                    # Snapshot the master once per split so later changes to the master aren't seen by the subjobs
+                    template = deepcopy(getattr(job, name))
+                    if template is not None:
+                        template._setParent(None)
+                    templates[name] = template
+                if templates[name] is not None:
+                    j._setCopyOnWrite(name, templates[name])
+                    continue
+            value = getattr(job, name)
+            if name == 'application' and hasattr(value, 'is_prepared'):
+                if value.is_prepared not in [None, True]:
+                    value.incrementShareCounter(value.is_prepared)
+            j.setSchemaAttribute(name, deepcopy(value))
+        return j
+
     def split(self, job):
         """ Return a list of subjobs generated from a master job.  The
         original  master  job should  not  be  modified.  This  method
@@ -65,19 +123,22 @@ class ISplitter(GangaObject):
         called directly by the framework and should not be modified in the derived
         classes. """
 
-        # try:
-        subjobs = self.split(stripProxy(job))
-        # except Exception,x:
-        #raise SplitterError(x)
-        #raise x
-        # if not len(subjobs):
-        #raise SplitterError('splitter did not create any subjobs')
+        master = stripProxy(job)
+        previous_context = getattr(_split_context, 'job', None), getattr(_split_context, 'templates', None)
+        _split_context.job = master
+        _split_context.templates = {}
+        try:
+            subjobs = self.split(master)
+        finally:
+            _split_context.job, _split_context.templates = previous_context
 
+        master_backend_type = type(stripProxy(job.backend))
         cnt = 0
         for s in subjobs:
-            if not isType(s.backend, type(stripProxy(job.backend))):
+            # Don't trigger a copy of a shared backend just to check its type
+            if not isType(stripProxy(s)._peekAttribute('backend'), master_backend_type):
                 raise SplitterError('masterjob backend %s is not the same as the subjob (probable subjob id=%d) backend %s' % (
-                    job.backend._name, cnt, getName(s.backend)))
+                    job.backend._name, cnt, getName(stripProxy(s)._peekAttribute('backend'))))
             cnt += 1
 
         return subjobs
@@ -49,7 +49,10 @@ def _getName(obj):
 
 logger = getLogger()
 
-do_not_copy = ['_index_cache_dict', '_parent', '_registry', '_data_dict', '_lock', '_proxyObject']
+do_not_copy = ['_index_cache_dict', '_parent', '_registry', '_data_dict', '_lock', '_proxyObject', '_cow_templates']
+
+# Serialises the materialisation of copy-on-write attributes, see GangaObject._setCopyOnWrite
+_cow_lock = threading.RLock()
 
 
 def synchronised(f):
@@ -358,6 +361,14 @@ class Descriptor(object):
         except KeyError:
             pass
 
+        # Then see if the attribute is still shared copy-on-write with another object
+        # This access will create a private copy of the attribute for this object
+        if obj._cow_templates is not None:
+            try:
+                return obj._materialiseCopyOnWrite(name)
+            except KeyError:
+                pass
+
         # Then try to get it from the index cache
         obj_index = obj._index_cache
         try:
@@ -727,6 +738,9 @@ class GangaObject(Node, metaclass=ObjectMetaclass):
     _should_init = True
     _should_load = False
 
+    # Schema attributes which are shared copy-on-write with a template object, see _setCopyOnWrite
+    _cow_templates = None
+
     @classmethod
     def getNew(cls, should_load=False, should_init=False):
         """
@@ -807,7 +821,7 @@ class GangaObject(Node, metaclass=ObjectMetaclass):
 
         for (name, item) in self._schema.componentItems():
             if item['visitable']:
-                visitor.componentAttribute(self, name, getattr(self, name), item['sequence'])
+                visitor.componentAttribute(self, name, self._peekAttribute(name), item['sequence'])
 
         visitor.nodeEnd(self)
 
@@ -830,7 +844,7 @@ class GangaObject(Node, metaclass=ObjectMetaclass):
             return node_info
 
         for attr_name, attr_object in self._schema.allItems():
-            value = getattr(self, attr_name)
+            value = self._peekAttribute(attr_name)
             if isType(value, (list, tuple)):
                 node_info[attr_name] = list(value)
             # GangaList has its own custom to_json() and thus that is called instead of JD.object_to_json
@@ -838,7 +852,7 @@ class GangaObject(Node, metaclass=ObjectMetaclass):
                 node_info[attr_name] = value.to_json()
             elif isinstance(value, GangaObject):
                 node_info[attr_name] = JsonDumper.object_to_json(
-                    attr_name, getattr(self, attr_name), [])
+                    attr_name, value, [])
             elif isinstance(value, dict) and attr_name == "timestamps":
                 for time_stamp, dtime in value.items():
                     if isinstance(dtime, datetime.datetime):
@@ -992,6 +1006,60 @@ class GangaObject(Node, metaclass=ObjectMetaclass):
         self._data[attrib_name] = attrib_value
         if isinstance(attrib_value, Node) and attrib_value._getParent() is not self:
             self._data[attrib_name]._setParent(self)
+        if self._cow_templates is not None:
+            self._cow_templates.pop(attrib_name, None)
+
+    def _setCopyOnWrite(self, attrib_name, template):
+        # type: (str, Any) -> None
+        """
+        Share template as the value of a schema attribute rather than storing a copy of it.
+        A private deepcopy of the template is only made once the attribute is first accessed through the descriptor.
+        The template is shared between all objects it is given to and must not be modified after this call.
+
+        Args:
+            attrib_name (str): the name of the schema attribute
+            template (GangaObject): the object which is to be shared
+        """
+        with _cow_lock:
+            if self._cow_templates is None:
+                self._cow_templates = {}
+            self._cow_templates[attrib_name] = template
+            self._data.pop(attrib_name, None)
+
+    def _materialiseCopyOnWrite(self, attrib_name):
+        # type: (str) -> Any
+        """
+        Replace a copy-on-write reference with a private copy of the template and return it.
+        Raises KeyError if the attribute is not shared copy-on-write
+
+        Args:
+            attrib_name (str): the name of the schema attribute
+        """
+        with _cow_lock:
+            # Another thread may have got here first
+            if attrib_name in self._data:
+                return self._data[attrib_name]
+            template = self._cow_templates[attrib_name]
+            value = deepcopy(template)
+            self.setSchemaAttribute(attrib_name, value)
+            return value
+
+    def _peekAttribute(self, attrib_name):
+        # type: (str) -> Any
+        """
+        Return the value of a schema attribute without making a private copy of a copy-on-write template.
+        This is intended for read-only consumers such as the streamers, the returned object must not be modified.
+
+        Args:
+            attrib_name (str): the name of the schema attribute
+        """
+        cow_templates = self._cow_templates
+        if cow_templates is not None and attrib_name not in self._data:
+            try:
+                return cow_templates[attrib_name]
+            except KeyError:
+                pass
+        return getattr(self, attrib_name)
 
     @property
     def _index_cache(self):
@@ -1507,11 +1507,10 @@ class Job(GangaObject):
         return jobmasterconfig
 
     @staticmethod
-    def _prepare_sj(rtHandler, i, app, sub_c, app_master_c, job_master_c, finished):
+    def _prepare_sj(rtHandler, app, sub_c, app_master_c, job_master_c):
         if app.is_prepared in [None, False]:
             app.prepare()
-        finished[i] = rtHandler.prepare(app, sub_c, app_master_c, job_master_c)
-        return
+        return rtHandler.prepare(app, sub_c, app_master_c, job_master_c)
 
     def _getJobSubConfig(self, subjobs):
 
@@ -1527,35 +1526,33 @@ class Job(GangaObject):
                 logger.debug("Job %s Calling rtHandler.prepare %s times" % (self.getFQID('.'), len(self.subjobs)))
                 logger.info("Preparing subjobs")
 
-                # Make an empty list
-                jobsubconfig = [None] * len(subjobs)
-
                 if self.parallel_submit is False:
                     jobsubconfig = [rtHandler.prepare(sub_job.application, sub_conf, appmasterconfig, jobmasterconfig) for (
                         sub_job, sub_conf) in zip(subjobs, appsubconfig)]
                 else:
+                    from GangaCore.Core.GangaThread.WorkerThreads.SubmissionExecutor import getSubmissionExecutor
+
+                    def _report_progress(n_done, n_total):
+                        if n_done % 1000 == 0 or n_done == n_total:
+                            logger.info("Prepared %s/%s subjobs" % (n_done, n_total))
+
+                    use_processes = getattr(rtHandler, 'cpu_bound_prepare', False) and getConfig('Queues')['PrepareInSubprocess']
+                    if use_processes:
+                        # Applications must be prepared in this process as changes made in a worker are lost
+                        for sub_j in subjobs:
+                            if sub_j.application.is_prepared in [None, False]:
+                                sub_j.application.prepare()
+                        prepare_func = rtHandler.prepare
+                        arg_list = [(sub_j.application, sub_conf, appmasterconfig, jobmasterconfig)
+                                    for sub_j, sub_conf in zip(subjobs, appsubconfig)]
+                    else:
+                        prepare_func = self._prepare_sj
+                        arg_list = [(rtHandler, sub_j.application, sub_conf, appmasterconfig, jobmasterconfig)
+                                    for sub_j, sub_conf in zip(subjobs, appsubconfig)]
 
-                    finished = {}
-
-                    from GangaCore.Core.GangaThread.WorkerThreads import getQueues
-                    index = 0
-                    for sub_j, sub_conf in zip(subjobs, appsubconfig):
-                        getQueues()._monitoring_threadpool.add_function(self._prepare_sj,
-                                                                        (
-                                                                            rtHandler,
-                                                                            index,
-                                                                            sub_j.application,
-                                                                            sub_conf,
-                                                                            appmasterconfig,
-                                                                            jobmasterconfig,
-                                                                            finished))
-                        index += 1
-
-                    while len(finished) != len(subjobs):
-                        time.sleep(0.25)
-
-                    for index in finished.keys():
-                        jobsubconfig[index] = finished[index]
+                    jobsubconfig = getSubmissionExecutor().map_ordered(prepare_func, arg_list,
+                                                                       use_processes=use_processes,
+                                                                       progress_callback=_report_progress)
 
         else:
             #   I am a sub-job, lets calculate my config
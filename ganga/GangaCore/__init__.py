@@ -207,6 +207,13 @@ queues_config = makeConfig("Queues", "configuration section for the queues")
 queues_config.addOption('Timeout', None, 'default timeout for queue generated processes')
 queues_config.addOption('ShutDownTimeout', 0.1, 'timeout before looping again over queue to give shutdown a chance')
 queues_config.addOption('NumWorkerThreads', 5, 'default number of worker threads in the queues system')
+queues_config.addOption('NumSubmissionThreads', 5,
+                        'number of threads used to prepare and submit subjobs when parallel_submit is enabled')
+queues_config.addOption('MaxSubmissionsPerBackend', 0,
+                        'maximum number of concurrent subjob submissions to a single backend type, 0 means no limit')
+queues_config.addOption('PrepareInSubprocess', False,
+                        ('run rtHandler.prepare in a process pool for runtime handlers which declare '
+                         'cpu_bound_prepare=True, requires the application and configs to be picklable'))
 
 # ------------------------------------------------
 # Plugins
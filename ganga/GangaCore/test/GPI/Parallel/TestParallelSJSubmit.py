@@ -0,0 +1,32 @@
+
+import pytest
+from GangaCore.testlib.decorators import add_config
+from GangaCore.testlib.monitoring import run_until_completed
+
+global_num_subjobs = 20
+
+
+@add_config([('TestingFramework', 'AutoCleanup', False),
+             ('Queues', 'NumSubmissionThreads', 4),
+             ('Queues', 'MaxSubmissionsPerBackend', 2)])
+@pytest.mark.usefixtures('gpi')
+class TestParallelSJSubmit(object):
+
+    def test_a_ParallelSubmit(self):
+        from GangaCore.GPI import ArgSplitter, Job, Local
+
+        j = Job(backend=Local(), splitter=ArgSplitter(args=[[i] for i in range(global_num_subjobs)]))
+        j.application.exe = 'echo'
+        j.parallel_submit = True
+        j.submit()
+
+        assert len(j.subjobs) == global_num_subjobs
+        for sj in j.subjobs:
+            assert sj.status != 'new'
+
+    def test_b_Finished(self):
+        from GangaCore.GPI import jobs
+
+        assert run_until_completed(jobs(0), sleep_period=0.1), 'Timeout on job submission: job is still not finished'
+        for sj in jobs(0).subjobs:
+            assert sj.status == 'completed'
@@ -0,0 +1,61 @@
+from GangaCore.GPIDev.Base.Proxy import stripProxy
+
+
+def _split(gpi, n):
+    j = gpi.Job()
+    j.backend = gpi.Local()
+    j.splitter = gpi.GenericSplitter()
+    j.splitter.attribute = 'application.args'
+    j.splitter.values = [[str(i)] for i in range(n)]
+    master = stripProxy(j)
+    return master, master.splitter.validatedSplit(master)
+
+
+def test_subjobs_share_backend_until_accessed(gpi):
+
+    master, subjobs = _split(gpi, 5)
+
+    templates = [sj._peekAttribute('backend') for sj in subjobs]
+    assert all(t is templates[0] for t in templates)
+    assert 'backend' not in subjobs[0]._data
+
+    # Accessing the attribute gives the subjob its own copy
+    backend = subjobs[0].backend
+    assert backend is not templates[0]
+    assert backend._getParent() is subjobs[0]
+    assert subjobs[1]._peekAttribute('backend') is templates[0]
+
+    # The shared snapshot isn't the master's own object
+    assert templates[0] is not master.backend
+
+
+def test_subjob_changes_are_private(gpi):
+
+    master, subjobs = _split(gpi, 3)
+
+    subjobs[0].backend.nice = 5
+    assert subjobs[1].backend.nice == master.backend.nice
+    assert subjobs[0].backend.nice == 5
+
+    assert [sj.application.args for sj in subjobs] == [['0'], ['1'], ['2']]
+
+
+def test_master_changes_after_split_not_seen(gpi):
+
+    master, subjobs = _split(gpi, 2)
+
+    master.backend.nice = 7
+    assert subjobs[0].backend.nice != 7
+
+
+def test_split_subjobs_persist(gpi):
+
+    j = gpi.Job()
+    j.backend = gpi.Local()
+    j.splitter = gpi.ArgSplitter(args=[[str(i)] for i in range(4)])
+    j.submit()
+
+    assert len(j.subjobs) == 4
+    for i, sj in enumerate(j.subjobs):
+        assert sj.application.args == [str(i)]
+        assert isinstance(stripProxy(sj.backend), type(stripProxy(j.backend)))
@@ -0,0 +1,60 @@
+import threading
+import time
+
+import pytest
+
+from GangaCore.Core.GangaThread.WorkerThreads.SubmissionExecutor import SubmissionExecutor
+
+
+def test_map_ordered_results():
+    """Results are returned in the order of the inputs regardless of completion order"""
+    executor = SubmissionExecutor(num_workers=4, group_limit=0)
+    try:
+        def slow_square(x):
+            time.sleep(0.01 * (5 - x % 5))
+            return x * x
+
+        progress = []
+        results = executor.map_ordered(slow_square, [(i, ) for i in range(20)],
+                                       progress_callback=lambda done, total: progress.append((done, total)))
+        assert results == [i * i for i in range(20)]
+        assert len(progress) == 20
+        assert progress[-1] == (20, 20)
+    finally:
+        executor.shutdown()
+
+
+def test_map_ordered_propagates_errors():
+    """An exception raised in a worker is re-raised in the caller rather than hanging"""
+    executor = SubmissionExecutor(num_workers=2, group_limit=0)
+    try:
+        def fail_on_three(x):
+            if x == 3:
+                raise ValueError('bad subjob %s' % x)
+            return x
+
+        with pytest.raises(ValueError):
+            executor.map_ordered(fail_on_three, [(i, ) for i in range(10)])
+    finally:
+        executor.shutdown()
+
+
+def test_group_limit():
+    """No more than group_limit calls run concurrently within a group"""
+    executor = SubmissionExecutor(num_workers=8, group_limit=2)
+    lock = threading.Lock()
+    state = {'running': 0, 'max': 0}
+
+    def work(_):
+        with lock:
+            state['running'] += 1
+            state['max'] = max(state['max'], state['running'])
+        time.sleep(0.02)
+        with lock:
+            state['running'] -= 1
+
+    try:
+        executor.map_ordered(work, [(i, ) for i in range(16)], group='Localhost')
+        assert state['max'] <= 2
+    finally:
+        executor.shutdown()
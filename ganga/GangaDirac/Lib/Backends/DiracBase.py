@@ -10,6 +10,7 @@ import datetime
 import shutil
 import tempfile
 import math
+import concurrent.futures
 from GangaCore.GPIDev.Schema import Schema, Version, SimpleItem, ComponentItem
 from GangaCore.GPIDev.Adapters.IBackend import IBackend, group_jobs_by_backend_credential
 from GangaCore.GPIDev.Lib.Job.Job import Job
@@ -302,7 +303,6 @@ class DiracBase(IBackend):
         nPerProcess = configDirac['maxSubjobsPerProcess']
         nProcessToUse = math.ceil((len(rjobs) * 1.0) / nPerProcess)
 
-        from GangaCore.Core.GangaThread.WorkerThreads import getQueues
         # Must check for credentials here as we cannot handle missing credentials on Queues by design!
         cred = None
         try:
@@ -326,65 +326,73 @@ class DiracBase(IBackend):
                                'Get a new grid certificate to be able to keep submitting jobs.'
                                % (remaining, uploaded_expiry.strftime('%d/%m/%Y')))
 
+        from GangaCore.Core.GangaThread.WorkerThreads.SubmissionExecutor import getSubmissionExecutor
+        block_futures = {}
         tmp_dir = tempfile.mkdtemp()
-        # Loop over the processes and create the master script for each one.
-        for i in range(0, int(nProcessToUse)):
-            nSubjobs = 0
-            # The Dirac IDs are stored in a dict so create it at the start of the script
-            masterScript = 'resultdict = {}\n'
-            for sc, sj in zip(subjobconfigs[i * nPerProcess:(i + 1) * nPerProcess],
-                              rjobs[i * nPerProcess:(i + 1) * nPerProcess]):
-                # Add in the script for each subjob
-                sj.updateStatus('submitting')
-                fqid = sj.getFQID('.')
-                # Change the output of the job script for our own ends.
-                # This is a bit of a hack but it saves having to rewrite every RTHandler
-                sjScript = sj.backend._job_script(sc, master_input_sandbox, tmp_dir)
-                sjScript = sjScript.replace(
-                    "output(result)", "if isinstance(result, dict) and 'Value' in result:\n"
-                    "\tresultdict.update({sjNo : result['Value']})\nelse:\n\tresultdict.update({sjNo : result['Message']})")
-                if nSubjobs == 0:
-                    sjScript = re.sub(r"(dirac = Dirac.*\(\))", r"\1\nsjNo='%s'\n" % fqid, sjScript)
-                if nSubjobs != 0:
+        try:
+            # Loop over the processes and create the master script for each one.
+            for i in range(0, int(nProcessToUse)):
+                nSubjobs = 0
+                # The Dirac IDs are stored in a dict so create it at the start of the script
+                masterScript = 'resultdict = {}\n'
+                for sc, sj in zip(subjobconfigs[i * nPerProcess:(i + 1) * nPerProcess],
+                                  rjobs[i * nPerProcess:(i + 1) * nPerProcess]):
+                    # Add in the script for each subjob
+                    sj.updateStatus('submitting')
+                    fqid = sj.getFQID('.')
+                    # Change the output of the job script for our own ends.
+                    # This is a bit of a hack but it saves having to rewrite every RTHandler
+                    sjScript = sj.backend._job_script(sc, master_input_sandbox, tmp_dir)
                     sjScript = sjScript.replace(
-                        "from DIRAC.Core.Base.Script import parseCommandLine\nparseCommandLine()\n", "\n")
-                    sjScript = re.sub(r"from .*DIRAC\.Interfaces\.API.Dirac.* import Dirac.*", "", sjScript)
-                    sjScript = re.sub(r"from .*DIRAC\.Interfaces\.API\..*Job import .*Job", "", sjScript)
-                    sjScript = re.sub(r"dirac = Dirac.*\(\)", "", sjScript)
-                    masterScript += "\nsjNo=\'%s\'" % fqid
-                masterScript += sjScript
-                nSubjobs += 1
-            # Return the dict of job numbers and Dirac IDs
-            masterScript += '\noutput(resultdict)\n'
-            dirac_script_filename = os.path.join(
-                self.getJobObject().getInputWorkspace().getPath(), 'dirac-script-%s.py') % i
-            with open(dirac_script_filename, 'w') as f:
-                f.write(masterScript)
-            upperlimit = (i + 1) * nPerProcess
-            if upperlimit > len(rjobs):
-                upperlimit = len(rjobs)
-
-            if (upperlimit - 1) == 0:
-                logger.info("Submitting job")
-            else:
-                logger.info("Submitting subjobs %s to %s" % (i * nPerProcess, upperlimit - 1))
-            try:
-                # Either do the submission in parallel with threads or sequentially
+                        "output(result)", "if isinstance(result, dict) and 'Value' in result:\n"
+                        "\tresultdict.update({sjNo : result['Value']})\nelse:\n\tresultdict.update({sjNo : result['Message']})")
+                    if nSubjobs == 0:
+                        sjScript = re.sub(r"(dirac = Dirac.*\(\))", r"\1\nsjNo='%s'\n" % fqid, sjScript)
+                    if nSubjobs != 0:
+                        sjScript = sjScript.replace(
+                            "from DIRAC.Core.Base.Script import parseCommandLine\nparseCommandLine()\n", "\n")
+                        sjScript = re.sub(r"from .*DIRAC\.Interfaces\.API.Dirac.* import Dirac.*", "", sjScript)
+                        sjScript = re.sub(r"from .*DIRAC\.Interfaces\.API\..*Job import .*Job", "", sjScript)
+                        sjScript = re.sub(r"dirac = Dirac.*\(\)", "", sjScript)
+                        masterScript += "\nsjNo=\'%s\'" % fqid
+                    masterScript += sjScript
+                    nSubjobs += 1
+                # Return the dict of job numbers and Dirac IDs
+                masterScript += '\noutput(resultdict)\n'
+                dirac_script_filename = os.path.join(
+                    self.getJobObject().getInputWorkspace().getPath(), 'dirac-script-%s.py') % i
+                with open(dirac_script_filename, 'w') as f:
+                    f.write(masterScript)
+                upperlimit = (i + 1) * nPerProcess
+                if upperlimit > len(rjobs):
+                    upperlimit = len(rjobs)
+
+                if (upperlimit - 1) == 0:
+                    logger.info("Submitting job")
+                else:
+                    logger.info("Submitting subjobs %s to %s" % (i * nPerProcess, upperlimit - 1))
+                # Either do the submission in parallel with the submission executor or sequentially
                 if parallel_submit:
-                    getQueues()._monitoring_threadpool.add_function(self._block_submit,
-                                                                    (dirac_script_filename, nSubjobs, keep_going))
+                    future = getSubmissionExecutor().submit(self._block_submit, dirac_script_filename, nSubjobs,
+                                                            keep_going, group=getName(self))
+                    block_futures[future] = (i * nPerProcess, upperlimit - 1)
                 else:
                     self._block_submit(dirac_script_filename, nSubjobs, keep_going)
+                    if (upperlimit - 1) == 0:
+                        logger.info("Submitted job")
+                    else:
+                        logger.info("Submitted subjobs %s to %s" % (i * nPerProcess, upperlimit - 1))
 
-                while not self._subjob_status_check(rjobs, nPerProcess, i):
-                    time.sleep(1.)
-            finally:
-                shutil.rmtree(tmp_dir, ignore_errors=True)
-
-            if (upperlimit - 1) == 0:
-                logger.info("Submitted job")
-            else:
-                logger.info("Submitted subjobs %s to %s" % (i * nPerProcess, upperlimit - 1))
+            for future in concurrent.futures.as_completed(block_futures):
+                first, last = block_futures[future]
+                try:
+                    future.result()
+                except Exception as err:
+                    logger.error("Error submitting subjobs %s to %s: %s" % (first, last, err))
+                else:
+                    logger.info("Submitted subjobs %s to %s" % (first, last))
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
 
         for i in rjobs:
             if i.status in ["new", "failed"]:
@@ -392,14 +400,6 @@ class DiracBase(IBackend):
 
         return 1
 
-    def _subjob_status_check(self, rjobs, nPerProcess, i):
-        has_submitted = True
-        for sj in rjobs[i * nPerProcess:(i + 1) * nPerProcess]:
-            if sj.status not in ["submitted", "failed", "completed", "running", "completing"]:
-                has_submitted = False
-                break
-        return has_submitted
-
     def _job_script(self, subjobconfig, master_input_sandbox, tmp_dir):
         """Get the script to submit a single DIRAC job
         Args: